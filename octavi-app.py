@@ -19,49 +19,116 @@ on Linux systems using udev rules.
 import sys
 import os
 import subprocess
-import glob
 import re
+import shlex
 import time
-from cryptography.fernet import Fernet
-from base64 import b64encode
+import atexit
+import ctypes
+import functools
+import html
+import stat
+import pwd
+import grp
+from collections import deque
 from PyQt6.QtWidgets import (QApplication, QMainWindow, QWidget, QVBoxLayout, 
                              QHBoxLayout, QPushButton, QTextEdit, QSplitter,
                              QListWidget, QInputDialog, QLineEdit, QLabel,
                              QStatusBar, QGridLayout)
 from PyQt6.QtGui import QIcon, QPixmap, QPainter, QColor
-from PyQt6.QtCore import Qt, QSize, QTimer, QRect, QPoint
+from PyQt6.QtCore import Qt, QSize, QRect, QPoint, QProcess, QSocketNotifier
+
+# Thin ctypes bindings for inotify so the rules directory can be watched
+# without an external dependency
+_libc = ctypes.CDLL('libc.so.6', use_errno=True)
+_IN_CLOSE_WRITE = 0x00000008
+_IN_MOVED_TO = 0x00000080
+_IN_CREATE = 0x00000100
+_IN_DELETE = 0x00000200
+
+# Patterns for matching hidraw records in the udev database
+_DEVNAME_RE = re.compile(r'DEVNAME=(/dev/hidraw\d+)')
+_HID_ID_RE = re.compile(r'DEVPATH=.*0003:([0-9A-Fa-f]{4}):([0-9A-Fa-f]{4})')
+
+def _hidraw_nodes():
+    """Enumerate /dev/hidraw* without globbing the whole of /dev through
+    fnmatch."""
+    return ['/dev/' + e.name for e in os.scandir('/dev') if e.name.startswith('hidraw')]
+
+@functools.lru_cache(maxsize=None)
+def _user_name(uid):
+    return pwd.getpwuid(uid).pw_name
+
+@functools.lru_cache(maxsize=None)
+def _group_name(gid):
+    return grp.getgrgid(gid).gr_name
+
+@functools.lru_cache(maxsize=None)
+def _themed_icon(name):
+    """Look up a theme icon once; later lookups skip the on-disk XDG cache."""
+    return QIcon.fromTheme(name)
+
+@functools.lru_cache(maxsize=None)
+def _sudo_composited(name):
+    """Base icon with the dialog-password badge overlaid, rendered once."""
+    icon = _themed_icon(name)
+    sudo_icon = _themed_icon("dialog-password")
+    combined_pixmap = QPixmap(32, 24)
+    combined_pixmap.fill(Qt.GlobalColor.transparent)
+    painter = QPainter(combined_pixmap)
+    painter.drawPixmap(0, 0, icon.pixmap(24, 24))
+    painter.drawPixmap(16, 8, sudo_icon.pixmap(16, 16))
+    painter.end()
+    return QIcon(combined_pixmap)
 
 class PasswordCache:
-    def __init__(self, timeout_minutes=10):
+    # Default matches the sudoers timestamp_timeout (5 minutes), so the
+    # cached password and the sudo timestamp expire together.
+    def __init__(self, timeout_minutes=5):
         self.timeout_minutes = timeout_minutes
-        self.key = Fernet.generate_key()
-        self.cipher_suite = Fernet(self.key)
-        self.cached_password = None
+        # Plain in-process buffer: encrypting with a key held in the same
+        # heap adds crypto work without changing the threat model, so the
+        # password lives in a bytearray that gets zeroed on clear instead.
+        self._buf = None
         self.cache_time = None
         self.cache_status_changed_callback = None
-    
+
     def set_status_callback(self, callback):
         self.cache_status_changed_callback = callback
-    
+
     def cache_password(self, password):
-        self.cached_password = self.cipher_suite.encrypt(password.encode())
+        self._buf = bytearray(password.encode())
         self.cache_time = time.time()
         if self.cache_status_changed_callback:
             self.cache_status_changed_callback(True)
-    
+
     def get_password(self):
-        if not self.cached_password or not self.cache_time:
+        if not self._buf or not self.cache_time:
             return None
-        
+
         # Check if cache has expired
         if time.time() - self.cache_time > (self.timeout_minutes * 60):
             self.clear_cache()
             return None
-            
-        return self.cipher_suite.decrypt(self.cached_password).decode()
+
+        return self._buf.decode()
     
+    def refresh_sudo_timestamp(self, password):
+        """Prime the sudoers per-user timestamp so later commands can use
+        sudo -n (non-interactive) without going through PAM again."""
+        subprocess.run(['sudo', '-S', '-v'], input=password + '\n',
+                       capture_output=True, text=True, check=True)
+        self.cache_time = time.time()
+
+    def invalidate_sudo_timestamp(self):
+        subprocess.run(['sudo', '-k'], check=False)
+
     def clear_cache(self):
-        self.cached_password = None
+        if self._buf is not None:
+            # Zero the buffer before releasing it so the password does not
+            # linger in freed heap memory
+            ctypes.memset((ctypes.c_char * len(self._buf)).from_buffer(self._buf),
+                          0, len(self._buf))
+            self._buf = None
         self.cache_time = None
         if self.cache_status_changed_callback:
             self.cache_status_changed_callback(False)
@@ -71,30 +138,35 @@ class RootStatusIcon(QLabel):
         super().__init__(parent)
         self.setFixedSize(16, 16)
         self.active = False
-        
-    def paintEvent(self, event):
-        painter = QPainter(self)
+        # Only two visual states, so render each once and let the default
+        # QLabel painting blit the cached pixmap on repaints
+        self._active_pix = self._render(QColor(255, 0, 0))  # Red when active
+        self._inactive_pix = self._render(QColor(128, 128, 128))  # Gray when inactive
+        self.setPixmap(self._inactive_pix)
+
+    @staticmethod
+    def _render(color):
+        pixmap = QPixmap(16, 16)
+        pixmap.fill(Qt.GlobalColor.transparent)
+        painter = QPainter(pixmap)
         painter.setRenderHint(QPainter.RenderHint.Antialiasing)
-        
+
         # Draw circle
-        if self.active:
-            painter.setBrush(QColor(255, 0, 0))  # Red when active
-        else:
-            painter.setBrush(QColor(128, 128, 128))  # Gray when inactive
-        
+        painter.setBrush(color)
         painter.setPen(Qt.PenStyle.NoPen)
         painter.drawEllipse(QPoint(8, 8), 7, 7)
-        
+
         # Draw exclamation mark
         painter.setPen(QColor(255, 255, 255))
         painter.drawLine(8, 4, 8, 9)
         painter.drawPoint(8, 11)
-        
+
         painter.end()
-    
+        return pixmap
+
     def set_active(self, active):
         self.active = active
-        self.update()
+        self.setPixmap(self._active_pix if active else self._inactive_pix)
 
 class UdevRulesApp(QMainWindow):
     def __init__(self):
@@ -102,6 +174,15 @@ class UdevRulesApp(QMainWindow):
         self.version = "0.011"  # Incremented version
         self.password_cache = PasswordCache()
         self.password_cache.set_status_callback(self.update_root_status)
+        atexit.register(self.password_cache.invalidate_sudo_timestamp)
+        # Privileged commands run through one QProcess so the event loop is
+        # never blocked; back-to-back button presses queue up in order
+        self._proc = QProcess(self)
+        self._proc.readyReadStandardOutput.connect(self._on_proc_output)
+        self._proc.finished.connect(self._on_proc_finished)
+        self._proc_queue = deque()
+        self._proc_output = ""
+        self._proc_callback = None
         self.initUI()
         self.list_octavi_rules()
 
@@ -292,9 +373,39 @@ class UdevRulesApp(QMainWindow):
         main_widget.setLayout(main_layout)
         self.setCentralWidget(main_widget)
         
+        # Refresh the rules list when the directory changes instead of only
+        # on button presses
+        self.watch_rules_dir()
+
         # Set initial instructions
         self.set_instructions()
 
+    def watch_rules_dir(self):
+        """Install an inotify watch on /etc/udev/rules.d so the list refreshes
+        when rules change; the List Rules button remains a manual fallback."""
+        self._inotify_fd = -1
+        fd = _libc.inotify_init1(os.O_NONBLOCK)
+        if fd < 0:
+            return
+        wd = _libc.inotify_add_watch(fd, b'/etc/udev/rules.d',
+                                     _IN_CREATE | _IN_DELETE | _IN_MOVED_TO | _IN_CLOSE_WRITE)
+        if wd < 0:
+            os.close(fd)
+            return
+        self._inotify_fd = fd
+        self._rules_notifier = QSocketNotifier(fd, QSocketNotifier.Type.Read, self)
+        self._rules_notifier.activated.connect(self._on_rules_dir_changed)
+
+    def _on_rules_dir_changed(self):
+        # Drain the queued events; any change means one relist, so their
+        # contents don't matter
+        try:
+            while os.read(self._inotify_fd, 4096):
+                pass
+        except BlockingIOError:
+            pass
+        self.list_octavi_rules()
+
     def create_modern_button(self, icon_name, text, sudo=False):
         """Create a modern-styled button with icon and text"""
         button = QPushButton(text)  # Create button with text
@@ -305,23 +416,10 @@ class UdevRulesApp(QMainWindow):
         layout.setContentsMargins(5, 0, 5, 0)
         layout.setSpacing(10)
         
-        # Add icon
-        icon = QIcon.fromTheme(icon_name)
-        button.setIcon(icon)
+        # Add icon, with the sudo badge composited in if needed
+        button.setIcon(_sudo_composited(icon_name) if sudo else _themed_icon(icon_name))
         button.setIconSize(QSize(24, 24))
-        
-        # Add sudo icon if needed
-        if sudo:
-            sudo_icon = QIcon.fromTheme("dialog-password")
-            # Create combined icon
-            combined_pixmap = QPixmap(32, 24)
-            combined_pixmap.fill(Qt.GlobalColor.transparent)
-            painter = QPainter(combined_pixmap)
-            painter.drawPixmap(0, 0, icon.pixmap(24, 24))
-            painter.drawPixmap(16, 8, sudo_icon.pixmap(16, 16))
-            painter.end()
-            button.setIcon(QIcon(combined_pixmap))
-        
+
         return button
 
     def list_octavi_rules(self):
@@ -333,9 +431,16 @@ class UdevRulesApp(QMainWindow):
                 self.output_text.setPlainText(f"Directory {rules_dir} does not exist.")
                 return
 
-            # List all files and filter for octavi
-            files = [f for f in os.listdir(rules_dir) if 'octavi' in f.lower()]
-            
+            # Scan the directory once; DirEntry carries the file type, so no
+            # extra stat is needed to skip non-files
+            entries = []
+            files = []
+            with os.scandir(rules_dir) as it:
+                for entry in it:
+                    entries.append(entry.name)
+                    if entry.is_file(follow_symlinks=False) and 'octavi' in entry.name.casefold():
+                        files.append(entry.name)
+
             # Add files to list widget
             for filename in files:
                 self.file_list.addItem(filename)
@@ -348,7 +453,7 @@ class UdevRulesApp(QMainWindow):
                 
             # Debug output
             self.output_text.append("\nSearched directory: " + rules_dir)
-            self.output_text.append("All files in directory: " + str(os.listdir(rules_dir)))
+            self.output_text.append("All files in directory: " + str(entries))
             
         except Exception as e:
             self.output_text.setPlainText(f"Error listing files: {str(e)}\n{type(e).__name__}")
@@ -369,167 +474,211 @@ class UdevRulesApp(QMainWindow):
     def trigger_rules(self):
         self.run_sudo_command("udevadm trigger")
 
-    def run_sudo_command(self, command, password=None, callback=None):
-        # Try to get cached password first
-        cached_password = self.password_cache.get_password()
-        
-        if cached_password:
-            password = cached_password
-        elif password is None:
-            password, ok = QInputDialog.getText(self, "Sudo Password", 
-                                              "Enter sudo password:", 
+    def ensure_sudo_session(self, password=None):
+        """Make sure the sudo timestamp is valid, prompting for the password
+        and caching it if needed. Returns True when sudo -n can be used."""
+        if self.password_cache.get_password():
+            return True
+
+        if password is None:
+            password, ok = QInputDialog.getText(self, "Sudo Password",
+                                              "Enter sudo password:",
                                               QLineEdit.EchoMode.Password)
             if not ok:
                 self.output_text.setPlainText("Operation cancelled.")
-                return
-            # Cache the new password
-            self.password_cache.cache_password(password)
+                return False
 
-        full_command = f"echo {password} | sudo -S {command}"
         try:
-            result = subprocess.run(full_command, shell=True, check=True, 
-                                  capture_output=True, text=True)
-            output = result.stdout if result.stdout else "Command executed successfully."
-            if callback:
-                callback(output)
-            else:
-                self.output_text.setPlainText(output)
+            self.password_cache.refresh_sudo_timestamp(password)
         except subprocess.CalledProcessError as e:
-            output = f"Error executing command: {e.stderr}"
-            self.output_text.setPlainText(output)
-            # If the error is due to wrong password, clear the cache
-            if "incorrect password" in e.stderr.lower():
+            self.output_text.setPlainText(f"Sudo authentication failed: {e.stderr}")
+            self.password_cache.clear_cache()
+            return False
+
+        # Cache the new password
+        self.password_cache.cache_password(password)
+        return True
+
+    def run_sudo_command(self, command, password=None, callback=None):
+        if not self.ensure_sudo_session(password):
+            return
+
+        self._proc_queue.append((shlex.split(command), callback))
+        if self._proc.state() == QProcess.ProcessState.NotRunning:
+            self._start_next_command()
+
+    def _start_next_command(self):
+        args, callback = self._proc_queue.popleft()
+        self._proc_output = ""
+        self._proc_callback = callback
+        self._proc.start('sudo', ['-n'] + args)
+
+    def _on_proc_output(self):
+        chunk = self._proc.readAllStandardOutput().data().decode(errors='replace')
+        self._proc_output += chunk
+        self.output_text.append(chunk.rstrip('\n'))
+
+    def _on_proc_finished(self, exit_code, exit_status):
+        output = self._proc_output
+        callback = self._proc_callback
+        self._proc_callback = None
+
+        if exit_code != 0:
+            stderr = self._proc.readAllStandardError().data().decode(errors='replace')
+            # Append so context the caller already rendered (e.g. the found
+            # device listing above a failed chmod) survives the error
+            self.output_text.append(f"Error executing command: {stderr}")
+            # If sudo rejected -n, the timestamp is no longer valid
+            if "password is required" in stderr.lower():
                 self.password_cache.clear_cache()
+        elif callback:
+            callback(output)
+        elif not output:
+            self.output_text.setPlainText("Command executed successfully.")
+
+        if self._proc_queue:
+            self._start_next_command()
 
     def show_hidraw_permissions(self):
         try:
-            hidraw_devices = glob.glob('/dev/hidraw*')
+            hidraw_devices = _hidraw_nodes()
             if not hidraw_devices:
                 self.output_text.setPlainText("No hidraw devices found.")
                 return
 
             output = "Hidraw device permissions:\n\n"
             for device in hidraw_devices:
-                ls_output = subprocess.check_output(['ls', '-l', device], universal_newlines=True).strip()
-                output += f"{ls_output}\n"
+                st = os.stat(device)
+                output += (f"{stat.filemode(st.st_mode)} "
+                           f"{_user_name(st.st_uid)} {_group_name(st.st_gid)} "
+                           f"{device}\n")
 
             self.output_text.setPlainText(output)
         except Exception as e:
             self.output_text.setPlainText(f"Error retrieving hidraw permissions: {str(e)}")
 
     def dmesg_hidraw(self):
-        def highlight_octavi_ifr1(output):
-            lines = output.split('\n')
+        if not self.ensure_sudo_session():
+            return
+
+        try:
+            dmesg_proc = subprocess.Popen(['sudo', '-n', 'dmesg'],
+                                          stdout=subprocess.PIPE,
+                                          stderr=subprocess.PIPE, text=True)
+            # Filter and format in one streamed pass instead of piping
+            # through grep and re-scanning the buffered output
             highlighted_lines = []
-            for line in lines:
-                if 'octavi ifr1' in line.lower():
-                    highlighted_lines.append(f"<b>{line}</b>")
+            for i, line in enumerate(dmesg_proc.stdout):
+                # Keep the GUI responsive on very large dmesg buffers; this
+                # must count every line, not just the matching ones
+                if i % 256 == 0:
+                    QApplication.processEvents()
+                lowered = line.lower()
+                if 'hidraw' not in lowered and 'octavi' not in lowered:
+                    continue
+                escaped = html.escape(line.rstrip())
+                if 'octavi ifr1' in lowered:
+                    highlighted_lines.append(f"<b>{escaped}</b>")
                 else:
-                    highlighted_lines.append(line)
-            return '<br>'.join(highlighted_lines)
-
-        def process_output(output):
-            highlighted_output = highlight_octavi_ifr1(output)
-            self.output_text.setHtml(highlighted_output)
-
-        self.run_sudo_command("dmesg | grep -i 'hidraw\\|octavi'", callback=process_output)
+                    highlighted_lines.append(escaped)
+            stderr = dmesg_proc.stderr.read()
+            if dmesg_proc.wait() != 0:
+                self.output_text.setPlainText(f"Error executing command: {stderr}")
+                # If sudo rejected -n, the timestamp is no longer valid
+                if "password is required" in stderr.lower():
+                    self.password_cache.clear_cache()
+                return
+            self.output_text.setHtml('<br>'.join(highlighted_lines))
+        except OSError as e:
+            self.output_text.setPlainText(f"Error reading kernel messages: {str(e)}")
 
     def create_udev_rule(self):
-        command = 'echo "SUBSYSTEM==\\"usb\\", ATTR{idVendor}==\\"04d8\\", ATTR{idProduct}==\\"e6d6\\", MODE=\\"0666\\", GROUP=\\"plugdev\\"" > /etc/udev/rules.d/99-octavi.rules'
-        self.run_sudo_command(command)
-        self.output_text.setPlainText("Udev rule created. Please reload rules and trigger udev for changes to take effect.")
-
-    def find_octavi_device(self, password):
-        # Cache the password if it's not already cached
-        if not self.password_cache.get_password():
-            self.password_cache.cache_password(password)
-            
+        # The redirection needs a shell, so run one explicitly under sudo
+        command = 'sh -c \'echo "SUBSYSTEM==\\"usb\\", ATTR{idVendor}==\\"04d8\\", ATTR{idProduct}==\\"e6d6\\", MODE=\\"0666\\", GROUP=\\"plugdev\\"" > /etc/udev/rules.d/99-octavi.rules\''
+        # The status text goes through the callback so it lands after the
+        # queued command finishes rather than being overwritten by it
+        self.run_sudo_command(command, callback=lambda _: self.output_text.setPlainText(
+            "Udev rule created. Please reload rules and trigger udev for changes to take effect."))
+
+    def find_octavi_device(self, password=None):
         VENDOR_ID = "04D8"
         PRODUCT_ID = "E6D6"
-        
-        found_devices = []
-        
+
         self.output_text.setPlainText("Searching for Octavi IFR1 devices...")
         QApplication.processEvents()
-        
-        hidraw_devices = glob.glob('/dev/hidraw*')
-        
-        for hidraw in hidraw_devices:
-            try:
-                device_info = subprocess.check_output(['sudo', '-S', 'udevadm', 'info', '--query=all', '--name=' + hidraw], 
-                                                  input=password if isinstance(password, bytes) else password.encode(),
-                                                  stderr=subprocess.PIPE)
-                
-                # Decode the bytes to a string
-                device_info_str = device_info.decode('utf-8')
-                
-                devpath_match = re.search(r'DEVPATH=.*0003:([0-9A-Fa-f]{4}):([0-9A-Fa-f]{4})', device_info_str)
-                
-                if devpath_match:
-                    current_vendor_id, current_product_id = devpath_match.groups()
-                    
-                    if current_vendor_id.upper() == VENDOR_ID and current_product_id.upper() == PRODUCT_ID:
-                        found_devices.append(hidraw)
-            except subprocess.CalledProcessError:
+
+        try:
+            # udevadm info needs no root for read-only queries, so the whole
+            # device database comes back in a single unprivileged call
+            export_db = subprocess.run(['udevadm', 'info', '--export-db'],
+                                     capture_output=True, text=True, check=True)
+        except (subprocess.CalledProcessError, OSError) as e:
+            self.output_text.setPlainText(f"Error querying udev database: {str(e)}")
+            return
+
+        found_devices = []
+        for record in export_db.stdout.split('\n\n'):
+            devname_match = _DEVNAME_RE.search(record)
+            if not devname_match:
                 continue
 
+            devpath_match = _HID_ID_RE.search(record)
+            if devpath_match:
+                current_vendor_id, current_product_id = devpath_match.groups()
+
+                if current_vendor_id.upper() == VENDOR_ID and current_product_id.upper() == PRODUCT_ID:
+                    found_devices.append(devname_match.group(1))
+
         if found_devices:
             result = "Found Octavi IFR1 device(s):\n"
             for device in found_devices:
                 result += f"{device}\n"
-                try:
-                    subprocess.run(['sudo', '-S', 'chmod', '0666', device], input=password.encode(), check=True)
-                    result += f"Applied chmod 0666 to {device}\n"
-                except subprocess.CalledProcessError:
-                    result += f"Failed to apply chmod 0666 to {device}\n"
+            self.output_text.setPlainText(result)
+            # chmod takes multiple paths, so one privileged call covers
+            # every device
+            devices = ' '.join(found_devices)
+            self.run_sudo_command(
+                f'chmod 0666 {devices}', password=password,
+                callback=lambda _: self.output_text.append(
+                    f"Applied chmod 0666 to {devices}"))
         else:
-            result = "No Octavi IFR1 devices found."
-
-        self.output_text.setPlainText(result)
+            self.output_text.setPlainText("No Octavi IFR1 devices found.")
         QApplication.processEvents()
 
     def run_find_octavi_device(self):
-        # Try to get cached password first
-        cached_password = self.password_cache.get_password()
-        
-        if cached_password:
-            password = cached_password
-        else:
-            password, ok = QInputDialog.getText(self, "Sudo Password", "Enter sudo password:", QLineEdit.EchoMode.Password)
-            if not ok:
-                self.output_text.setPlainText("Operation cancelled.")
-                return
-            # Cache the new password
-            self.password_cache.cache_password(password)
-        
+        if not self.ensure_sudo_session():
+            return
+
         self.output_text.clear()
-        self.output_text.setPlainText("Preparing to search for Octavi IFR1 devices...")
-        QTimer.singleShot(100, lambda: self.find_octavi_device(password))
+        self.find_octavi_device()
 
     def check_plugdev_group(self):
         current_user = os.getenv('USER')
-        
+
         try:
             # Check if plugdev group exists
-            result = subprocess.run(['getent', 'group', 'plugdev'], 
-                                  capture_output=True, text=True)
-            
-            if result.returncode != 0:
-                # Group doesn't exist, create it
-                self.run_sudo_command('groupadd plugdev')
-                self.output_text.setPlainText("Created plugdev group.\n")
-            
-            # Check if user is in the group
-            groups_output = subprocess.check_output(['groups', current_user], 
-                                                 universal_newlines=True)
-            
-            if 'plugdev' not in groups_output:
+            try:
+                grp.getgrnam('plugdev')
+            except KeyError:
+                # Group doesn't exist, create it; report once the queued
+                # command has actually finished
+                self.run_sudo_command('groupadd plugdev',
+                                      callback=lambda _: self.output_text.setPlainText(
+                                          "Created plugdev group.\n"))
+
+            # Check if user is in the group; getgrouplist gives the real gid
+            # list, so the test is exact rather than a substring match
+            gids = os.getgrouplist(current_user, pwd.getpwnam(current_user).pw_gid)
+            group_names = {grp.getgrgid(gid).gr_name for gid in gids}
+
+            if 'plugdev' not in group_names:
                 # User not in group, add them
-                self.run_sudo_command(f'usermod -a -G plugdev {current_user}')
-                self.output_text.setPlainText(
-                    f"Added user {current_user} to plugdev group.\n"
-                    "Please log out and log back in for changes to take effect."
-                )
+                self.run_sudo_command(
+                    f'usermod -a -G plugdev {current_user}',
+                    callback=lambda _: self.output_text.setPlainText(
+                        f"Added user {current_user} to plugdev group.\n"
+                        "Please log out and log back in for changes to take effect."
+                    ))
             else:
                 self.output_text.setPlainText(
                     f"User {current_user} is already in the plugdev group."
@@ -556,8 +705,18 @@ class UdevRulesApp(QMainWindow):
         self.instructions_text.setPlainText(instructions)
 
     def closeEvent(self, event):
-        # Clear password cache when application closes
+        # Clear password cache and drop the sudo timestamp when the
+        # application closes
+        if self._inotify_fd >= 0:
+            self._rules_notifier.setEnabled(False)
+            os.close(self._inotify_fd)
+            self._inotify_fd = -1
+        self._proc_queue.clear()
+        if self._proc.state() != QProcess.ProcessState.NotRunning:
+            self._proc.kill()
+            self._proc.waitForFinished(1000)
         self.password_cache.clear_cache()
+        self.password_cache.invalidate_sudo_timestamp()
         super().closeEvent(event)
 
     def update_root_status(self, active):